@@ -10,6 +10,8 @@ SessionStart hook that:
 
 import json
 import os
+import re
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Dict, List, Set
 
@@ -252,86 +254,112 @@ def get_project_dir() -> Path:
     return Path(os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd()))
 
 
-def has_code(project_dir: Path) -> bool:
+def _scan_top_level(project_dir: Path) -> Dict[str, bool]:
+    """Map each top-level entry name to whether it is a directory.
+
+    One directory read answers every indicator and signature check below,
+    instead of a stat per candidate file.
+    """
+    try:
+        with os.scandir(project_dir) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+
+def has_code(project_dir: Path, top_level: Dict[str, bool]) -> bool:
     """Check if project has any code or config files."""
-    for indicator in CODE_INDICATORS:
-        if (project_dir / indicator).exists():
-            return True
+    if any(indicator in top_level for indicator in CODE_INDICATORS):
+        return True
 
-    # Also check for any source files in immediate subdirs
+    # Also check for any source files in immediate subdirs.
+    # os.scandir entries carry the file type from the directory read, so
+    # is_file()/is_dir() don't cost a stat per entry.
     source_extensions = {".py", ".js", ".ts", ".go", ".rs", ".rb", ".java", ".kt", ".swift"}
-    try:
-        for item in project_dir.iterdir():
-            if item.is_file() and item.suffix in source_extensions:
+    for name, is_dir in top_level.items():
+        if not is_dir:
+            if os.path.splitext(name)[1] in source_extensions:
                 return True
-            if item.is_dir() and not item.name.startswith("."):
-                for subitem in item.iterdir():
-                    if subitem.is_file() and subitem.suffix in source_extensions:
-                        return True
-    except PermissionError:
-        pass
+        elif not name.startswith("."):
+            try:
+                with os.scandir(project_dir / name) as subentries:
+                    for subentry in subentries:
+                        if subentry.is_file() and os.path.splitext(subentry.name)[1] in source_extensions:
+                            return True
+            except PermissionError:
+                pass
 
     return False
 
 
-def _read_project_deps(project_dir: Path) -> Set[str]:
+# Config files read for dependency names and project-type indicators
+CONFIG_FILES = ["package.json", "requirements.txt", "pyproject.toml"]
+
+
+def _read_config_files(project_dir: Path) -> Dict[str, str]:
+    """Read each config file once; missing or unreadable files are omitted."""
+    configs: Dict[str, str] = {}
+    for name in CONFIG_FILES:
+        try:
+            configs[name] = (project_dir / name).read_text()
+        except OSError:
+            pass
+    return configs
+
+
+# Leading PEP 508 distribution name, optionally inside a TOML string
+DEP_NAME_PATTERN = re.compile(r'["\']?([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+
+def _read_project_deps(configs: Dict[str, str]) -> Set[str]:
     """Read dependency names from common config files."""
     deps: Set[str] = set()
 
     # package.json
-    pkg_json = project_dir / "package.json"
-    if pkg_json.exists():
+    if "package.json" in configs:
         try:
-            data = json.loads(pkg_json.read_text())
+            data = json.loads(configs["package.json"])
             for key in ("dependencies", "devDependencies"):
                 if key in data and isinstance(data[key], dict):
                     deps.update(data[key].keys())
-        except (json.JSONDecodeError, OSError):
+        except json.JSONDecodeError:
             pass
 
     # requirements.txt
-    req_txt = project_dir / "requirements.txt"
-    if req_txt.exists():
-        try:
-            for line in req_txt.read_text().splitlines():
-                line = line.strip()
-                if line and not line.startswith(("#", "-")):
-                    # Extract package name before version specifier
-                    name = line.split("==")[0].split(">=")[0].split("<=")[0].split("[")[0].strip()
-                    if name:
-                        deps.add(name.lower())
-        except OSError:
-            pass
+    if "requirements.txt" in configs:
+        for line in configs["requirements.txt"].splitlines():
+            line = line.strip()
+            if line and not line.startswith(("#", "-")):
+                # Extract package name before version specifier
+                match = DEP_NAME_PATTERN.match(line)
+                if match:
+                    deps.add(match.group(1).lower())
 
     # pyproject.toml - simple parsing without toml library
-    pyproject = project_dir / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            content = pyproject.read_text()
-            # Look for dependency strings in common sections
-            in_deps = False
-            for line in content.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("[") and "dependencies" in stripped.lower():
-                    in_deps = True
-                    continue
-                elif stripped.startswith("["):
-                    in_deps = False
-                    continue
-                if in_deps and stripped.startswith('"'):
-                    name = stripped.strip('"').strip("'").split(">=")[0].split("==")[0].split("[")[0].strip()
-                    if name:
-                        deps.add(name.lower())
-        except OSError:
-            pass
+    if "pyproject.toml" in configs:
+        # Look for dependency strings in common sections
+        in_deps = False
+        for line in configs["pyproject.toml"].splitlines():
+            stripped = line.strip()
+            if stripped.startswith("[") and "dependencies" in stripped.lower():
+                in_deps = True
+                continue
+            elif stripped.startswith("["):
+                in_deps = False
+                continue
+            if in_deps and stripped.startswith('"'):
+                match = DEP_NAME_PATTERN.match(stripped)
+                if match:
+                    deps.add(match.group(1).lower())
 
     return deps
 
 
-def detect_project_types(project_dir: Path) -> List[str]:
+def detect_project_types(project_dir: Path, top_level: Dict[str, bool]) -> List[str]:
     """Detect project types based on file signatures, directories, and dependencies."""
     detected: List[str] = []
-    deps = _read_project_deps(project_dir)
+    configs = _read_config_files(project_dir)
+    deps = _read_project_deps(configs)
 
     for proj_type, signatures in PROJECT_TYPE_SIGNATURES.items():
         matched = False
@@ -339,24 +367,28 @@ def detect_project_types(project_dir: Path) -> List[str]:
         # Check files (supports glob patterns)
         for pattern in signatures.get("files", []):
             if "*" in pattern:
-                if list(project_dir.glob(pattern)):
+                if any(fnmatch(name, pattern) for name in top_level):
+                    matched = True
+                    break
+            elif "/" in pattern:
+                if (project_dir / pattern).exists():
                     matched = True
                     break
-            elif (project_dir / pattern).exists():
+            elif pattern in top_level:
                 matched = True
                 break
 
         # Check directories
         if not matched:
             for d in signatures.get("dirs", []):
-                if (project_dir / d).is_dir():
+                if top_level.get(d, False):
                     matched = True
                     break
 
         # Check config files
         if not matched:
             for cfg in signatures.get("configs", []):
-                if (project_dir / cfg).exists():
+                if cfg in top_level:
                     matched = True
                     break
 
@@ -371,14 +403,9 @@ def detect_project_types(project_dir: Path) -> List[str]:
         if not matched:
             for indicator in signatures.get("indicators", []):
                 for cfg_file in ["pyproject.toml", "package.json"]:
-                    cfg_path = project_dir / cfg_file
-                    if cfg_path.exists():
-                        try:
-                            if indicator in cfg_path.read_text():
-                                matched = True
-                                break
-                        except OSError:
-                            pass
+                    if indicator in configs.get(cfg_file, ""):
+                        matched = True
+                        break
                 if matched:
                     break
 
@@ -426,9 +453,10 @@ def check_rules_exist(project_dir: Path) -> dict:
             }
 
     # Slow-path: no rules yet. Detect project type to drive generation.
-    detected_types = detect_project_types(project_dir)
+    top_level = _scan_top_level(project_dir)
+    detected_types = detect_project_types(project_dir, top_level)
 
-    if has_code(project_dir):
+    if has_code(project_dir, top_level):
         return {"additionalContext": _build_generation_instructions(detected_types)}
     else:
         return {"additionalContext": NEW_PROJECT_INSTRUCTIONS}
@@ -112,6 +112,12 @@ COMMENT_PATTERNS = {
     },
 }
 
+# count_comment_lines runs these on every line, so compile them once.
+COMPILED_COMMENT_PATTERNS = {
+    suffix: {key: re.compile(pattern) for key, pattern in patterns.items()}
+    for suffix, patterns in COMMENT_PATTERNS.items()
+}
+
 
 def count_comment_lines(content: str, patterns: Dict) -> Tuple[int, int]:
     """
@@ -142,21 +148,21 @@ def count_comment_lines(content: str, patterns: Dict) -> Tuple[int, int]:
         # Check for block comment end
         if in_block_comment:
             comment_lines += 1
-            if block_end_pattern and re.search(block_end_pattern, line):
+            if block_end_pattern and block_end_pattern.search(line):
                 in_block_comment = False
                 block_end_pattern = None
             continue
 
         # Check for block comment start
-        if block_start and re.search(block_start, line):
+        if block_start and block_start.search(line):
             comment_lines += 1
-            if not (block_end and re.search(block_end, line)):
+            if not (block_end and block_end.search(line)):
                 in_block_comment = True
                 block_end_pattern = block_end
             continue
 
         # Check for alternate block comment start (Python triple quotes)
-        if alt_block_start and re.search(alt_block_start, line):
+        if alt_block_start and alt_block_start.search(line):
             comment_lines += 1
             if not (alt_block_end and line.count('"""') >= 2 or line.count("'''") >= 2):
                 in_block_comment = True
@@ -164,7 +170,7 @@ def count_comment_lines(content: str, patterns: Dict) -> Tuple[int, int]:
             continue
 
         # Check for line comment
-        if line_pattern and re.match(line_pattern, line):
+        if line_pattern and line_pattern.match(line):
             comment_lines += 1
 
     return comment_lines, total_lines
@@ -196,7 +202,7 @@ def check_file(file_path: str) -> Optional[Dict]:
     if content.count("\n") > 500:
         return None
 
-    patterns = COMMENT_PATTERNS[suffix]
+    patterns = COMPILED_COMMENT_PATTERNS[suffix]
     comment_lines, total_lines = count_comment_lines(content, patterns)
 
     if total_lines == 0:
@@ -220,9 +226,8 @@ def main() -> None:
     """Main entry point for the hook."""
     # Read hook input from stdin
     try:
-        hook_input = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        print(json.dumps({}))
+        hook_input = json.loads(sys.stdin.buffer.read())
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return
 
     # Get the tool call info
@@ -231,21 +236,22 @@ def main() -> None:
 
     # Only check Write and Edit tools
     if tool_name not in ["Write", "Edit", "MultiEdit"]:
-        print(json.dumps({}))
         return
 
     # Get the file path from the tool input
     file_path = tool_input.get("file_path")
     if not file_path:
-        print(json.dumps({}))
         return
 
     # Check the file's comment ratio
     warning = check_file(file_path)
 
-    if warning:
-        result = {
-            "additionalContext": f"""## Comment Ratio Warning
+    # No warning: emit nothing. Empty stdout is a no-op for the hook runner.
+    if not warning:
+        return
+
+    result = {
+        "additionalContext": f"""## Comment Ratio Warning
 
 The file `{warning['file']}` has a high comment-to-code ratio:
 - **{warning['ratio']}%** of lines are comments ({warning['comment_lines']}/{warning['total_lines']} lines)
@@ -258,9 +264,7 @@ The file `{warning['file']}` has a high comment-to-code ratio:
 4. Consider if complex code needs refactoring instead of commenting
 
 Only add comments when they provide value the code cannot express itself."""
-        }
-    else:
-        result = {}
+    }
 
     print(json.dumps(result))
 
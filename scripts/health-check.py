@@ -13,11 +13,42 @@ Validates plugin integrity:
 """
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
 
 
+# Specific patterns to avoid matching prose like "spawn 3-5 agents".
+# Compiled once: extract_counts runs them against every count-bearing doc.
+COUNT_PATTERNS = {
+    "command": [
+        re.compile(r'(\d+)\s+(?:slash\s+)?commands?\b', re.IGNORECASE),
+        re.compile(r'Commands\s*\|\s*(\d+)\s*\|', re.IGNORECASE),
+        re.compile(r'`commands/`\s*-\s*(\d+)\s+slash command', re.IGNORECASE),
+    ],
+    "agent": [
+        re.compile(r'(\d+)\s+(?:real-expertise\s+)?agent(?:\s+persona)?s?\b', re.IGNORECASE),
+        re.compile(r'Agents\s*\|\s*(\d+)\s*\|', re.IGNORECASE),
+        re.compile(r'`agents/`\s*-\s*(\d+)\s+(?:real-expertise\s+)?agent', re.IGNORECASE),
+    ],
+    "skill": [
+        re.compile(r'(\d+)\s+(?:auto-invoked\s+)?skills?\b', re.IGNORECASE),
+        re.compile(r'Skills\s*\|\s*(\d+)\s*\|', re.IGNORECASE),
+        re.compile(r'`skills/`\s*-\s*(\d+)\s+auto-invoked skill', re.IGNORECASE),
+    ],
+    "hook": [
+        re.compile(r'(\d+)\s+(?:lifecycle\s+)?hooks?\b', re.IGNORECASE),
+        re.compile(r'Hooks\s*\|\s*(\d+)\s*\|', re.IGNORECASE),
+    ],
+    "template": [
+        re.compile(r'(\d+)\s+rule generation templates?\b', re.IGNORECASE),
+        re.compile(r'Rule Templates\s*\|\s*(\d+)\s*\|', re.IGNORECASE),
+        re.compile(r'`rules-templates/`\s*-\s*(\d+)\s+rule generation template', re.IGNORECASE),
+    ],
+}
+
+
 def get_project_root() -> Path:
     return Path(__file__).parent.parent
 
@@ -72,8 +103,10 @@ def check_skills(project_root: Path) -> list:
             issues.append(f"skills/{skill_dir.name}/ missing SKILL.md")
             continue
 
-        content = skill_file.read_text()
-        if not content.startswith("---"):
+        # Only the opening fence is checked; don't read the whole skill
+        with open(skill_file) as f:
+            head = f.read(3)
+        if head != "---":
             issues.append(f"skills/{skill_dir.name}/SKILL.md missing YAML frontmatter (does not start with ---)")
 
     return issues
@@ -83,37 +116,9 @@ def extract_counts(text: str) -> dict:
     """Extract component counts from text using common patterns."""
     counts = {}
 
-    # Specific patterns to avoid matching prose like "spawn 3-5 agents"
-    patterns = {
-        "command": [
-            r'(\d+)\s+(?:slash\s+)?commands?\b',
-            r'Commands\s*\|\s*(\d+)\s*\|',
-            r'`commands/`\s*-\s*(\d+)\s+slash command',
-        ],
-        "agent": [
-            r'(\d+)\s+(?:real-expertise\s+)?agent(?:\s+persona)?s?\b',
-            r'Agents\s*\|\s*(\d+)\s*\|',
-            r'`agents/`\s*-\s*(\d+)\s+(?:real-expertise\s+)?agent',
-        ],
-        "skill": [
-            r'(\d+)\s+(?:auto-invoked\s+)?skills?\b',
-            r'Skills\s*\|\s*(\d+)\s*\|',
-            r'`skills/`\s*-\s*(\d+)\s+auto-invoked skill',
-        ],
-        "hook": [
-            r'(\d+)\s+(?:lifecycle\s+)?hooks?\b',
-            r'Hooks\s*\|\s*(\d+)\s*\|',
-        ],
-        "template": [
-            r'(\d+)\s+rule generation templates?\b',
-            r'Rule Templates\s*\|\s*(\d+)\s*\|',
-            r'`rules-templates/`\s*-\s*(\d+)\s+rule generation template',
-        ],
-    }
-
-    for component, component_patterns in patterns.items():
+    for component, component_patterns in COUNT_PATTERNS.items():
         for pattern in component_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if not match:
                 continue
             for group in match.groups():
@@ -238,6 +243,24 @@ def check_removed_command_refs(project_root: Path) -> list:
     return issues
 
 
+# Directories that never contain a plugin's skills root; not walked
+CE_CACHE_SKIP_DIRS = {".git", "__pycache__", "node_modules"}
+
+
+def _find_skills_dirs(root: Path) -> list:
+    """Find `skills` directories under root without walking into them.
+
+    The cache keeps a full plugin checkout per version, so descending into each
+    skills tree (or .git) to look for more `skills` dirs dominates the walk.
+    """
+    found = []
+    for dirpath, dirnames, _ in os.walk(root):
+        if "skills" in dirnames:
+            found.append(Path(dirpath) / "skills")
+        dirnames[:] = [d for d in dirnames if d != "skills" and d not in CE_CACHE_SKIP_DIRS]
+    return found
+
+
 def _ce_version_key(skills_dir: Path) -> tuple:
     version_dir = skills_dir.parent
     numbers = tuple(int(part) for part in re.findall(r"\d+", version_dir.name))
@@ -262,7 +285,7 @@ def check_ce_skill_refs(project_root: Path) -> list:
             "INFO: compound-engineering plugin cache not found; skipping CE skill reference validation"
         ]
 
-    skills_dirs = [path for path in ce_cache.rglob("skills") if path.is_dir()]
+    skills_dirs = _find_skills_dirs(ce_cache)
     if not skills_dirs:
         return [
             "WARNING: compound-engineering plugin cache found, but no skills directory was found"
@@ -17,6 +17,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'lib'))
 from utils import print_warning, is_test_file
 
+# Patterns to detect, in report order: (group name, pattern, label)
+DEBUG_PATTERNS = [
+    ('console_log', r'\bconsole\.log\s*\(', 'console.log'),
+    ('console_debug', r'\bconsole\.debug\s*\(', 'console.debug'),
+    ('console_info', r'\bconsole\.info\s*\(', 'console.info (use logger instead)'),
+    ('debugger', r'\bdebugger\b', 'debugger statement'),
+]
+
+# One alternation scans a line once; match.lastgroup names the pattern hit
+DEBUG_RE = re.compile('|'.join(f'(?P<{group}>{pattern})' for group, pattern, _ in DEBUG_PATTERNS))
+
 
 def check_for_console_logs(content: str, file_path: str) -> list:
     """
@@ -29,23 +40,20 @@ def check_for_console_logs(content: str, file_path: str) -> list:
 
     issues = []
 
-    # Patterns to detect
-    patterns = [
-        (r'\bconsole\.log\s*\(', 'console.log'),
-        (r'\bconsole\.debug\s*\(', 'console.debug'),
-        (r'\bconsole\.info\s*\(', 'console.info (use logger instead)'),
-        (r'\bdebugger\b', 'debugger statement'),
-    ]
-
     lines = content.split('\n')
     for line_num, line in enumerate(lines, 1):
+        # Every pattern needs one of these literals; skip the regexes otherwise
+        if 'console.' not in line and 'debugger' not in line:
+            continue
+
         # Skip if commented
         stripped = line.strip()
         if stripped.startswith('//') or stripped.startswith('*'):
             continue
 
-        for pattern, name in patterns:
-            if re.search(pattern, line):
+        found = {match.lastgroup for match in DEBUG_RE.finditer(line)}
+        for group, _, name in DEBUG_PATTERNS:
+            if group in found:
                 issues.append({
                     'line': line_num,
                     'type': name,
@@ -58,9 +66,9 @@ def check_for_console_logs(content: str, file_path: str) -> list:
 def main():
     """Main entry point."""
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = json.loads(sys.stdin.buffer.read())
         tool_input = hook_data.get('tool_input', {})
-    except (json.JSONDecodeError, Exception):
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return
 
     if not tool_input:
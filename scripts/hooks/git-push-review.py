@@ -26,7 +26,7 @@ def get_unpushed_commits() -> int:
         ])
 
     if success and stdout:
-        return len(stdout.strip().split('\n'))
+        return stdout.strip().count('\n') + 1
     return 0
 
 
@@ -40,9 +40,9 @@ def main():
     """Main entry point."""
     # Early exit: only run git checks when the bash command involves "push"
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = json.loads(sys.stdin.buffer.read())
         command = hook_data.get('tool_input', {}).get('command', '')
-    except (json.JSONDecodeError, Exception):
+    except (json.JSONDecodeError, UnicodeDecodeError):
         command = ''
 
     if 'push' not in command:
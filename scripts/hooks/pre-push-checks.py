@@ -6,6 +6,7 @@ so Claude can fix missing items before the push goes through.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -13,18 +14,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'lib'))
 from utils import run_command, get_project_root
 
 
-def get_changed_files():
+def get_changed_files(project_root):
     """Get files changed between HEAD and origin/main (or upstream)."""
     success, stdout, _ = run_command([
         'git', 'diff', '--name-only', 'origin/main...HEAD'
-    ])
+    ], cwd=project_root)
     if not success:
         # Fallback: diff against upstream tracking branch
         success, stdout, _ = run_command([
             'git', 'log', '@{u}..HEAD', '--name-only', '--format='
-        ])
+        ], cwd=project_root)
     if success and stdout:
-        return [f for f in stdout.strip().split('\n') if f]
+        # git log --name-only repeats a file once per commit touching it;
+        # dedupe while keeping first-seen order
+        return list(dict.fromkeys(f for f in stdout.strip().split('\n') if f))
     return []
 
 
@@ -34,11 +37,7 @@ def has_code_changes(files):
                  '.java', '.kt', '.swift', '.c', '.cpp', '.h', '.cs', '.sh'}
     doc_only = {'.md', '.txt', '.rst', '.json', '.yaml', '.yml', '.toml'}
 
-    for f in files:
-        ext = Path(f).suffix.lower()
-        if ext in code_exts:
-            return True
-    return False
+    return not code_exts.isdisjoint(os.path.splitext(f)[1].lower() for f in files)
 
 
 def check_changelog(files, project_root):
@@ -116,9 +115,9 @@ def check_docs(files, project_root):
 
 def main():
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = json.loads(sys.stdin.buffer.read())
         command = hook_data.get('tool_input', {}).get('command', '')
-    except (json.JSONDecodeError, Exception):
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return
 
     # Only fire on git push commands
@@ -126,7 +125,7 @@ def main():
         return
 
     project_root = get_project_root()
-    files = get_changed_files()
+    files = get_changed_files(project_root)
 
     if not files:
         return
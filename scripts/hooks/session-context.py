@@ -10,6 +10,7 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add lib to path
@@ -39,13 +40,22 @@ def get_git_context(project_root: Path) -> str:
     """Gather recent git context."""
     sections = []
 
+    # The git queries are independent; run them concurrently so SessionStart
+    # waits on the slowest one instead of the sum of all five.
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        branch_f = pool.submit(run_git, ['branch', '--show-current'], project_root)
+        status_f = pool.submit(run_git, ['status', '--short'], project_root)
+        log_f = pool.submit(run_git, ['log', '--oneline', '-20', '--no-decorate'], project_root)
+        diff_stat_f = pool.submit(run_git, ['diff', '--stat', 'HEAD~5', 'HEAD'], project_root)
+        uncommitted_stat_f = pool.submit(run_git, ['diff', '--stat', 'HEAD'], project_root)
+
     # Current branch
-    branch = run_git(['branch', '--show-current'], project_root)
+    branch = branch_f.result()
     if branch:
         sections.append(f"Branch: {branch}")
 
     # Uncommitted changes
-    status = run_git(['status', '--short'], project_root)
+    status = status_f.result()
     if status:
         lines = status.splitlines()
         sections.append(f"Uncommitted changes ({len(lines)} files):\n{status}")
@@ -53,17 +63,17 @@ def get_git_context(project_root: Path) -> str:
         sections.append("Working tree clean")
 
     # Recent commits
-    log = run_git(['log', '--oneline', '-20', '--no-decorate'], project_root)
+    log = log_f.result()
     if log:
         sections.append(f"Recent commits:\n{log}")
 
     # What changed recently (diff stat of last 5 commits)
-    diff_stat = run_git(['diff', '--stat', 'HEAD~5', 'HEAD'], project_root)
+    diff_stat = diff_stat_f.result()
     if diff_stat:
         sections.append(f"Recent committed changes:\n{diff_stat}")
 
     # Uncommitted diff stat (staged + unstaged combined)
-    uncommitted_stat = run_git(['diff', '--stat', 'HEAD'], project_root)
+    uncommitted_stat = uncommitted_stat_f.result()
     if uncommitted_stat:
         sections.append(f"Uncommitted change scope:\n{uncommitted_stat}")
 
@@ -74,18 +84,18 @@ def get_memory_context() -> str:
     """Read Claude's native auto-memory for semantic context."""
     memory_path = get_native_auto_memory_path()
 
-    if not memory_path.exists():
-        return ''
-
     try:
-        content = memory_path.read_text()
-        # Truncate to ~2000 chars to avoid bloating context
-        if len(content) > 2000:
-            content = content[:2000] + '\n\n[... truncated]'
-        return content
+        # Truncate to ~2000 chars to avoid bloating context; one char past the
+        # limit is enough to know truncation happened, so skip the rest.
+        with open(memory_path) as f:
+            content = f.read(2001)
     except OSError:
         return ''
 
+    if len(content) > 2000:
+        content = content[:2000] + '\n\n[... truncated]'
+    return content
+
 
 def build_context() -> str:
     """Build the full session context string."""
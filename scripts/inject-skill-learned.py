@@ -39,20 +39,17 @@ def main():
         skill_dir = os.environ.get("CLAUDE_SKILL_DIR", "")
 
     if not skill_dir:
-        print(json.dumps({}))
         return
 
     learned_path = os.path.join(skill_dir, "learned.md")
 
     if not os.path.exists(learned_path):
-        print(json.dumps({}))
         return
 
     try:
         with open(learned_path, "r") as f:
             content = f.read().strip()
     except Exception:
-        print(json.dumps({}))
         return
 
     # Extract entries (lines starting with "- " that are not empty placeholders)
@@ -63,7 +60,6 @@ def main():
             entries.append(line_stripped)
 
     if not entries:
-        print(json.dumps({}))
         return
 
     # Derive skill name from directory
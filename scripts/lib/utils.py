@@ -4,24 +4,40 @@ Cross-platform utility functions for CDF hook scripts.
 """
 
 import json
-import subprocess
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# Files/dirs that mark a project root
+PROJECT_MARKERS = frozenset(['.git', 'package.json', 'pyproject.toml', 'Cargo.toml', 'go.mod'])
 
+# Characters Claude replaces with '-' when deriving a project's auto-memory key
+PROJECT_KEY_PATTERN = re.compile(r'[^a-zA-Z0-9-]')
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the current project root directory."""
-    cwd = Path.cwd()
+    """Get the current project root directory.
 
-    # Look for common project markers
-    markers = ['.git', 'package.json', 'pyproject.toml', 'Cargo.toml', 'go.mod']
+    Cached: a hook process never changes cwd, so the upward marker walk runs
+    once no matter how many helpers (run_command, memory path) ask for it.
+    """
+    cwd = Path.cwd()
 
     current = cwd
     while current != current.parent:
-        for marker in markers:
-            if (current / marker).exists():
-                return current
+        # One directory read per level instead of a stat per marker
+        try:
+            with os.scandir(current) as entries:
+                found = any(entry.name in PROJECT_MARKERS for entry in entries)
+        except OSError:
+            # Execute-only directories can't be listed; probe markers directly
+            found = any((current / marker).exists() for marker in PROJECT_MARKERS)
+        if found:
+            return current
         current = current.parent
 
     return cwd
@@ -51,6 +67,9 @@ def run_command(cmd: list, cwd: Optional[Path] = None, timeout: int = 30) -> tup
     """
     Run a shell command and return (success, stdout, stderr).
     """
+    # Imported here: hooks that only need the path/print helpers
+    # (console-log-detector) shouldn't pay for subprocess on every edit.
+    import subprocess
     try:
         result = subprocess.run(
             cmd,
@@ -79,13 +98,10 @@ def print_info(message: str) -> None:
 def is_test_file(path: str) -> bool:
     """Check if a file is a test file."""
     name = Path(path).name.lower()
-    return any([
-        '.test.' in name,
-        '.spec.' in name,
-        name.startswith('test_'),
-        '/test/' in path.lower(),
-        '/__tests__/' in path.lower()
-    ])
+    if '.test.' in name or '.spec.' in name or name.startswith('test_'):
+        return True
+    lowered = path.lower()
+    return '/test/' in lowered or '/__tests__/' in lowered
 
 
 
@@ -95,7 +111,6 @@ def get_native_auto_memory_path() -> Path:
     Claude's auto-memory lives at ~/.claude/projects/<project-key>/memory/MEMORY.md
     where <project-key> replaces all non-alphanumeric chars (except -) with '-'.
     """
-    import re
     project_root = str(get_project_root())
-    project_key = re.sub(r'[^a-zA-Z0-9-]', '-', project_root)
+    project_key = PROJECT_KEY_PATTERN.sub('-', project_root)
     return Path.home() / '.claude' / 'projects' / project_key / 'memory' / 'MEMORY.md'